@@ -36,7 +36,7 @@ def setup_package():
 
     # Extra optional dependencies
     docs_extras = ["sphinx", "sphinx_rtd_theme", "numpydoc"]
-    test_extras = ["pytest"]
+    test_extras = ["pytest", "pytest-xdist"]
     dev_extras = docs_extras + test_extras
     opt_extras = ["platypus-opt", "pygmo"]
 
@@ -23,9 +23,11 @@ def test_linear_model(simple_linear_model, in_flow, out_flow, benefit):
     Test the simple_linear_model with different basic input and output values
     """
 
-    simple_linear_model.nodes["Input"].max_flow = in_flow
-    simple_linear_model.nodes["Output"].min_flow = out_flow
-    simple_linear_model.nodes["Output"].cost = -benefit
+    inpt = simple_linear_model.nodes["Input"]
+    otpt = simple_linear_model.nodes["Output"]
+    inpt.max_flow = in_flow
+    otpt.min_flow = out_flow
+    otpt.cost = -benefit
 
     expected_sent = in_flow if benefit > 1.0 else out_flow
 
@@ -83,7 +85,9 @@ def linear_model_with_storage(request):
 
     strg.connect(otpt)
     lnk.connect(strg)
-    avail_volume = max(current_volume - min_volume, 0.0)
+    avail_volume = current_volume - min_volume
+    if avail_volume < 0.0:
+        avail_volume = 0.0
     avail_refill = max_volume - current_volume
     expected_sent = (
         in_flow + min(max_strg_out, avail_volume)
@@ -211,12 +215,12 @@ def two_cross_domain_output_single_input(request):
     # Create river network
     for i in range(2):
         river_inpt = pywr.core.Input(
-            model, name="Catchment {}".format(i), max_flow=river_flow, domain="river"
+            model, name=f"Catchment {i}", max_flow=river_flow, domain="river"
         )
-        river_lnk = pywr.core.Link(model, name="Reach {}".format(i), domain="river")
+        river_lnk = pywr.core.Link(model, name=f"Reach {i}", domain="river")
         river_inpt.connect(river_lnk)
         river_otpt = pywr.core.Output(
-            model, name="Abstraction {}".format(i), domain="river", cost=0.0
+            model, name=f"Abstraction {i}", domain="river", cost=0.0
         )
         river_lnk.connect(river_otpt)
         # Connect grid to river
@@ -224,9 +228,9 @@ def two_cross_domain_output_single_input(request):
 
         expected_node_results.update(
             {
-                "Catchment {}".format(i): river_flow,
-                "Reach {}".format(i): river_flow,
-                "Abstraction {}".format(i): river_flow,
+                river_inpt.name: river_flow,
+                river_lnk.name: river_flow,
+                river_otpt.name: river_flow,
             }
         )
 
@@ -285,13 +289,19 @@ def test_simple_linear_inline_model(
     Test the test_simple_linear_inline_model with different flow constraints
     """
     model = simple_linear_inline_model
-    model.nodes["Input 0"].max_flow = 10.0
-    model.nodes["Input 1"].max_flow = in_flow_1
-    model.nodes["Link"].max_flow = link_flow
-    model.nodes["Output 0"].max_flow = out_flow_0
-    model.nodes["Input 1"].cost = 1.0
-    model.nodes["Output 0"].cost = -10.0
-    model.nodes["Output 1"].cost = -5.0
+    inpt0 = model.nodes["Input 0"]
+    inpt1 = model.nodes["Input 1"]
+    lnk = model.nodes["Link"]
+    otpt0 = model.nodes["Output 0"]
+    otpt1 = model.nodes["Output 1"]
+
+    inpt0.max_flow = 10.0
+    inpt1.max_flow = in_flow_1
+    lnk.max_flow = link_flow
+    otpt0.max_flow = out_flow_0
+    inpt1.cost = 1.0
+    otpt0.cost = -10.0
+    otpt1.cost = -5.0
 
     expected_sent = min(link_flow, 10 + in_flow_1)
 
@@ -371,12 +381,14 @@ def make_simple_model(supply_amplitude, demand, frequency, initial_volume):
     S = supply_amplitude
     w = frequency
 
+    # The supply is periodic so precompute it for every possible day of the year.
+    # Take the mean flow of the day (i.e. offset by half a day)
+    t = np.arange(367, dtype=np.float64) - 0.5
+    supply_table = S * np.cos(t * w) + S
+
     class SupplyFunc(pywr.parameters.Parameter):
         def value(self, ts, si):
-            # Take the mean flow of the day (i.e. offset by half a day)
-            t = ts.dayofyear - 0.5
-            v = S * np.cos(t * w) + S
-            return v
+            return supply_table[ts.dayofyear]
 
     max_flow = SupplyFunc(model)
     supply = pywr.core.Input(model, name="supply", max_flow=max_flow, min_flow=max_flow)
@@ -411,11 +423,13 @@ def test_analytical():
 
     T = np.arange(1, 365)
     V_anal = S * (np.sin(w * T) / w + T) - D * T + V0
-    V_model = np.empty(T.shape)
+    V_model = []
 
-    for i, t in enumerate(T):
+    res = model.nodes["reservoir"]
+    for _ in T:
         model.step()
-        V_model[i] = model.nodes["reservoir"].volume[0]
+        V_model.append(res.volume[0])
+    V_model = np.asarray(V_model, dtype=np.float64)
 
     # Relative error from initial volume
     error = np.abs(V_model - V_anal) / V0